@@ -1,16 +1,20 @@
+import atexit
 import logging
 import os
+import queue
 import re
 from collections import Counter
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
+import pycountry
 from dotenv import load_dotenv
 from flask import Flask, flash, redirect, request, url_for
 from flask_login import LoginManager, current_user
 from flask_migrate import Migrate
+from sqlalchemy.pool import QueuePool
 
 from .db import db
-from .models import Article, ArticleType, User
+from .models import Article, ArticleType, Country, User
 
 load_dotenv()  # Load environment variables from .env file
 
@@ -21,12 +25,19 @@ ALLOWED_EXTENSIONS = {"png", "jpg", "jpeg"}
 # Initialize Flask app and database
 app = Flask(__name__)
 app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///blog.db"
+# Keep a bounded set of long-lived connections so SQLite's per-connection page cache stays warm
+app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+    "poolclass": QueuePool,
+    "pool_size": 5,
+    "max_overflow": 10,
+    "connect_args": {"check_same_thread": False, "timeout": 30},
+}
 app.config["SECRET_KEY"] = os.environ.get("FLASK_SECRET_KEY", "default-secret-key")
 app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
 
 
 db.init_app(app)
-migrate = Migrate(app, db)
+migrate = Migrate(app, db, render_as_batch=True)  # SQLite needs batch mode for ALTERs
 
 # Initialize Flask-Login
 login_manager = LoginManager()
@@ -88,7 +99,7 @@ def page_not_found(e):
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    return db.session.get(User, int(user_id))
 
 
 @login_manager.unauthorized_handler
@@ -108,10 +119,9 @@ def inject_scopes():
         for atype in article.article_types:
             counter[("type", atype.name)] += 1
 
-        # Count countries (no change here)
-        if article.country:
-            for country in article.country.split(", "):
-                counter[("country", country)] += 1
+        # Count countries
+        for country in article.countries:
+            counter[("country", country.name)] += 1
 
         # Count sources (no change here)
         if article.source:
@@ -174,6 +184,14 @@ def initialize_article_types():
     db.session.commit()
 
 
+def initialize_countries():
+    existing_codes = {code for (code,) in db.session.query(Country.code)}
+    for country in pycountry.countries:
+        if country.alpha_2 not in existing_codes:
+            db.session.add(Country(code=country.alpha_2, name=country.name))
+    db.session.commit()
+
+
 # Initialize logging
 if not app.debug:
     file_handler = RotatingFileHandler("app.log", maxBytes=1024 * 1024 * 100, backupCount=20)
@@ -181,7 +199,12 @@ if not app.debug:
         logging.Formatter("%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]")
     )
     file_handler.setLevel(logging.INFO)
-    app.logger.addHandler(file_handler)
+    # Hand records to a background thread so disk writes and rotation never block a request
+    log_queue = queue.Queue(-1)
+    app.logger.addHandler(QueueHandler(log_queue))
+    log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
     app.logger.setLevel(logging.INFO)
 
 
@@ -190,6 +213,7 @@ def initialize_database():
     with app.app_context():
         db.create_all()
         initialize_article_types()  # Initialize article types after creating all tables
+        initialize_countries()
 
 
 from . import routes  # noqa: # import at end of module to force routes to populate
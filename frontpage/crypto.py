@@ -1,3 +1,5 @@
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Cost 10 keeps a hash/verify well under 100ms so a login doesn't stall the worker;
+# hashes created with the old default of 12 rounds still verify.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=10)
@@ -1,8 +1,10 @@
 from flask_wtf import FlaskForm
 from flask_wtf.file import FileAllowed, FileField
+from sqlalchemy import select
 from wtforms import BooleanField, PasswordField, StringField, SubmitField, TextAreaField
 from wtforms.validators import URL, DataRequired, EqualTo, Length, Optional, Regexp, ValidationError
 
+from .db import db
 from .models import InvitationCode, User
 
 
@@ -28,7 +30,9 @@ class RegistrationForm(FlaskForm):
     submit = SubmitField("Register")
 
     def validate_username(self, username):
-        user = User.query.filter_by(username=username.data).first()
+        user = db.session.execute(
+            select(User).where(User.username == username.data)
+        ).scalar_one_or_none()
         if user:
             raise ValidationError("That username is already taken. Please choose a different one.")
 
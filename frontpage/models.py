@@ -22,6 +22,9 @@ article_article_types = db.Table(
 
 # User model
 class User(UserMixin, db.Model):
+    # Never hand a deleted user's id to a new account
+    __table_args__ = {"sqlite_autoincrement": True}
+
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(100), unique=True)
     password_hash = db.Column(db.String(100))
@@ -48,6 +51,9 @@ class User(UserMixin, db.Model):
 class Category(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(50), nullable=False, unique=True)
+    articles = db.relationship(
+        "Article", secondary="article_categories", lazy=True, back_populates="categories"
+    )
 
     def __repr__(self):
         return "<Category %r>" % self.name
@@ -61,14 +67,34 @@ article_categories = db.Table(
 )
 
 
+class Country(db.Model):
+    code = db.Column(db.String(2), primary_key=True)  # ISO 3166-1 alpha-2
+    name = db.Column(db.String(100), nullable=False, unique=True)
+
+    def __repr__(self):
+        return "<Country %r>" % self.name
+
+
+# Association table for articles and countries
+article_countries = db.Table(
+    "article_countries",
+    db.Column("article_id", db.Integer, db.ForeignKey("article.id"), primary_key=True),
+    db.Column("country_code", db.String(2), db.ForeignKey("country.code"), primary_key=True),
+)
+
+# Every association table keyed on article.id; bulk article deletes must clear all of them
+article_link_tables = (article_article_types, article_categories, article_countries)
+
+
 # Define the Article model
 class Article(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     title = db.Column(db.String(100), nullable=False)
     content = db.Column(db.Text, nullable=False)
-    author = db.Column(db.String(50), nullable=False)
-    publish_date = db.Column(db.DateTime, default=datetime.utcnow)
-    country = db.Column(db.String(50))
+    content_html = db.Column(db.Text)
+    excerpt = db.Column(db.String(255))
+    author_id = db.Column(db.Integer, db.ForeignKey("user.id"), index=True)
+    publish_date = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     download_link = db.Column(db.String(255))
     download_link2 = db.Column(db.String(255))
     download_link3 = db.Column(db.String(255))
@@ -86,14 +112,23 @@ class Article(db.Model):
     external_collaboration2 = db.Column(db.String(255))
     external_collaboration3 = db.Column(db.String(255))
     article_type = db.Column(db.String(50))
-    source = db.Column(db.String(255))
+    source = db.Column(db.String(255), index=True)
     last_edited = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     slug = db.Column(db.String(255), unique=True, nullable=False)
     pending_approval = db.Column(db.Boolean, default=False, nullable=False)
+    author = db.relationship("User", lazy="joined")
     categories = db.relationship(
         "Category",
         secondary=article_categories,
-        lazy="subquery",
+        lazy="raise_on_sql",  # Callers must ask for categories with selectinload()
+        back_populates="articles",
+    )
+    countries = db.relationship(
+        "Country",
+        secondary=article_countries,
+        lazy="selectin",
+        order_by="Country.name",
         backref=db.backref("articles", lazy=True),
     )
     article_types = db.relationship(
@@ -106,6 +141,16 @@ class Article(db.Model):
     def __repr__(self):
         return "<Article %r>" % self.title
 
+    @property
+    def author_name(self):
+        # Articles outlive their author's account
+        return self.author.username if self.author else "[deleted]"
+
+    @property
+    def summary(self):
+        # Set on publish/edit and backfilled by the migration for older articles
+        return self.excerpt
+
     def set_slug(self):
         if not self.slug:
             self.slug = slugify(self.title)
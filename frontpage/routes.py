@@ -1,15 +1,22 @@
+import functools
+import hashlib
+import html
 import os
 import re
+import threading
 from collections import Counter
 from datetime import datetime
 from itertools import groupby
 
 import markdown
 import pycountry
-from flask import flash, redirect, render_template, request, url_for
+from flask import abort, flash, make_response, redirect, render_template, request, session, url_for
 from flask_login import current_user, login_required, login_user, logout_user
+from markupsafe import Markup
 from slugify import slugify
+from sqlalchemy import and_, delete, or_, select, update
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 from werkzeug.utils import secure_filename
 
 from . import app, inject_scopes, format_size, parse_size
@@ -23,7 +30,41 @@ from .forms import (
     RegistrationForm,
     TeamPageForm,
 )
-from .models import Article, ArticleType, Category, InvitationCode, User
+from .models import (
+    Article,
+    ArticleType,
+    Category,
+    Country,
+    InvitationCode,
+    User,
+    article_categories,
+    article_link_tables,
+)
+
+# Markdown instances are expensive to build but not thread-safe, so keep one per thread
+_md_local = threading.local()
+
+
+def render_markdown(text):
+    md = getattr(_md_local, "md", None)
+    if md is None:
+        md = _md_local.md = markdown.Markdown()
+    return md.reset().convert(text)
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def make_excerpt(content_html, max_chars=200):
+    # Plain-text preview of rendered HTML, computed once when an article is saved
+    text = " ".join(html.unescape(_TAG_RE.sub(" ", content_html)).split())
+    return text if len(text) <= max_chars else text[:max_chars] + "..."
+
+
+# pycountry's database never changes at runtime, so build the (code, name) list once
+_COUNTRIES = tuple(
+    sorted(((country.alpha_2, country.name) for country in pycountry.countries), key=lambda c: c[1])
+)
 
 
 @app.route("/register", methods=["GET", "POST"])
@@ -56,9 +97,12 @@ def register():
 @app.route("/login", methods=["GET", "POST"])
 def login():
     if request.method == "POST":
-        username = request.form["username"]
-        password = request.form["password"]
-        user = User.query.filter_by(username=username).first()
+        form = request.form
+        username = form.get("username", "")
+        password = form.get("password", "")
+        user = db.session.execute(
+            select(User).where(User.username == username)
+        ).scalar_one_or_none()
 
         if user and user.check_password(password):
             login_user(user)
@@ -75,17 +119,104 @@ def logout():
     return redirect(url_for("home"))
 
 
+# Feed cursors look like "<publish_date isoformat>_<article id>"
+def parse_feed_cursor(cursor):
+    try:
+        publish_date_str, article_id = cursor.rsplit("_", 1)
+        return datetime.fromisoformat(publish_date_str), int(article_id)
+    except (AttributeError, ValueError):
+        return None
+
+
+def make_feed_cursor(article):
+    return f"{article.publish_date.isoformat()}_{article.id}"
+
+
+def public_page_etag():
+    # Pages that look the same to every anonymous visitor can be revalidated with an ETag;
+    # logged-in views and pending flash messages differ per session, so they get none.
+    if current_user.is_authenticated or session.get("_flashes"):
+        return None
+
+    # Every article insert/update bumps MAX(updated_at) and every delete changes COUNT(*),
+    # which also covers the related-article lists and scopes shown around each page
+    article_count, latest_update = db.session.execute(
+        select(db.func.count(Article.id), db.func.max(Article.updated_at))
+    ).one()
+    show_team_link = User.query.filter_by(include_in_team_page=True).first() is not None
+    token = f"{article_count}|{latest_update}|{show_team_link}|{request.url}"
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def not_modified(etag):
+    response = make_response("", 304)
+    response.set_etag(etag)
+    return response
+
+
+def with_etag(page, etag):
+    response = make_response(page)
+    if etag:
+        response.set_etag(etag)
+        response.headers["Cache-Control"] = "no-cache"
+        response.vary.add("Cookie")
+    return response
+
+
+@functools.lru_cache(maxsize=4096)
+def render_article_card(article_id, updated_at, author_name, category_names):
+    # Every field the card shows is part of the key, so a changed article simply misses.
+    # The article is already in the session's identity map, so this doesn't query.
+    article = db.session.get(Article, article_id)
+    card = app.jinja_env.get_template("article_card.html")
+    return Markup(card.render(article=article, category_names=category_names))
+
+
 @app.route("/")
 def home():
-    max_articles = 10
+    etag = public_page_etag()
+    if etag and request.if_none_match.contains(etag):
+        return not_modified(etag)
 
-    # Only fetch articles that are not pending approval
-    main_articles = (
-        Article.query.filter_by(pending_approval=False)
-        .order_by(Article.publish_date.desc())
-        .limit(max_articles)
-        .all()
+    max_articles = 10
+    page_size = min(max(request.args.get("limit", max_articles, type=int), 1), 50)
+    cursor = parse_feed_cursor(request.args.get("cursor"))
+
+    # Only fetch articles that are not pending approval. Category names come back
+    # as one joined string per article, so no Category objects are built for the feed.
+    main_articles_query = (
+        select(Article, db.func.group_concat(Category.name, ", ").label("category_names"))
+        .outerjoin(article_categories, article_categories.c.article_id == Article.id)
+        .outerjoin(Category, Category.id == article_categories.c.category_id)
+        .options(joinedload(Article.author))
+        .where(Article.pending_approval.is_(False))
+        .group_by(Article.id)
+        .order_by(Article.publish_date.desc(), Article.id.desc())
+        .limit(page_size + 1)  # One extra row tells us whether an older page exists
     )
+    if cursor:
+        # Keyset pagination: seek past the last article shown instead of using OFFSET
+        cursor_date, cursor_id = cursor
+        main_articles_query = main_articles_query.where(
+            or_(
+                Article.publish_date < cursor_date,
+                and_(Article.publish_date == cursor_date, Article.id < cursor_id),
+            )
+        )
+    if app.debug:
+        # Surface any relationship the feed touches without an explicit loader
+        main_articles_query = main_articles_query.options(raiseload("*"))
+    main_articles = db.session.execute(main_articles_query).all()
+
+    next_cursor = None
+    if len(main_articles) > page_size:
+        main_articles = main_articles[:page_size]
+        next_cursor = make_feed_cursor(main_articles[-1].Article)
+
+    main_article_cards = [
+        render_article_card(article.id, article.updated_at, article.author_name, category_names)
+        for article, category_names in main_articles
+    ]
 
     main_articles_total = Article.query.count()
 
@@ -112,12 +243,15 @@ def home():
 
     show_team_link = User.query.filter_by(include_in_team_page=True).first() is not None
 
-    return render_template(
+    page = render_template(
         "home.html",
         title="Home",
-        main_articles=main_articles,
+        main_article_cards=main_article_cards,
         main_articles_total=main_articles_total,
         main_articles_more=main_articles_total > max_articles,
+        next_cursor=next_cursor,
+        # Keep a custom page size on the Older link; url_for drops None values
+        page_limit=page_size if page_size != max_articles else None,
         recently_edited_articles=recently_edited_articles,
         recently_edited_articles_total=recently_edited_articles_total,
         recently_edited_articles_more=recently_edited_articles_total > max_articles,
@@ -127,43 +261,50 @@ def home():
         show_team_link=show_team_link,
     )
 
+    return with_etag(page, etag)
+
 
 # Protect the publish route
 @app.route("/publish", methods=["GET", "POST"])
 @login_required
 def publish():
     categories = Category.query.all()
-    countries = [country.name for country in pycountry.countries]
+    countries = _COUNTRIES
     article_types = ArticleType.query.all()  # Fetch article types from the database
 
     if request.method == "POST":
-        article_title = request.form["title"]
-        article_content = request.form["content"]
-        article_countries = request.form.getlist("countries")
-        article_country = ", ".join(article_countries)
-        selected_article_type_ids = request.form.getlist("article_types")
+        form = request.form
+        article_title = form.get("title", "")
+        article_content = form.get("content", "")
+        # Unknown codes simply don't match a Country row
+        selected_countries = Country.query.filter(Country.code.in_(form.getlist("countries"))).all()
+        selected_article_type_ids = form.getlist("article_types")
         selected_article_types = ArticleType.query.filter(
             ArticleType.id.in_(selected_article_type_ids)
         ).all()
-        article_download_link = request.form["download_link"]
-        article_download_link2 = request.form["download_link2"]
-        article_download_link3 = request.form["download_link3"]
-        article_magnet_link = request.form["magnet_link"]
-        article_magnet_link2 = request.form["magnet_link2"]
-        article_magnet_link3 = request.form["magnet_link3"]
-        article_torrent_link = request.form["torrent_link"]
-        article_torrent_link2 = request.form["torrent_link2"]
-        article_torrent_link3 = request.form["torrent_link3"]
-        article_ipfs_link = request.form["ipfs_link"]
-        article_ipfs_link2 = request.form["ipfs_link2"]
-        article_ipfs_link3 = request.form["ipfs_link3"]
-        article_download_size = request.form["download_size"]
-        article_external_collaboration = request.form.get("external_collaboration")
-        article_external_collaboration2 = request.form.get("external_collaboration2")
-        article_external_collaboration3 = request.form.get("external_collaboration3")
-        article_source = request.form["source"]
+        article_download_link = form.get("download_link", "")
+        article_download_link2 = form.get("download_link2", "")
+        article_download_link3 = form.get("download_link3", "")
+        article_magnet_link = form.get("magnet_link", "")
+        article_magnet_link2 = form.get("magnet_link2", "")
+        article_magnet_link3 = form.get("magnet_link3", "")
+        article_torrent_link = form.get("torrent_link", "")
+        article_torrent_link2 = form.get("torrent_link2", "")
+        article_torrent_link3 = form.get("torrent_link3", "")
+        article_ipfs_link = form.get("ipfs_link", "")
+        article_ipfs_link2 = form.get("ipfs_link2", "")
+        article_ipfs_link3 = form.get("ipfs_link3", "")
+        article_download_size = form.get("download_size", "")
+        article_external_collaboration = form.get("external_collaboration")
+        article_external_collaboration2 = form.get("external_collaboration2")
+        article_external_collaboration3 = form.get("external_collaboration3")
+        article_source = form.get("source", "")
         requires_approval = current_user.requires_approval
 
+        if not article_title.strip() or not article_content.strip():
+            flash("⛔️ Title and content are required.", "danger")
+            return redirect(url_for("publish"))
+
         article_download_size_bytes = None  # Default to None if no size is provided
 
         # Only attempt conversion if a size is provided
@@ -177,11 +318,20 @@ def publish():
                 )
                 return redirect(url_for("publish"))
 
+        # Handle article categories; only the ids are needed to write the link rows.
+        # Look them up before building the Article so autoflush never sees it half-made
+        selected_category_ids = db.session.scalars(
+            select(Category.id).where(Category.id.in_(form.getlist("categories")))
+        ).all()
+
+        article_content_html = render_markdown(article_content)
         new_article = Article(
             title=article_title,
             content=article_content,
-            author=current_user.username,
-            country=article_country,
+            content_html=article_content_html,
+            excerpt=make_excerpt(article_content_html),
+            author_id=current_user.id,
+            countries=selected_countries,
             download_link=article_download_link,
             download_link2=article_download_link2,
             download_link3=article_download_link3,
@@ -204,7 +354,7 @@ def publish():
         )
 
         # Extract and handle the publication date
-        publish_date_str = request.form.get("publish_date")
+        publish_date_str = form.get("publish_date")
         if publish_date_str:
             publish_date = datetime.strptime(publish_date_str, "%Y-%m-%dT%H:%M")
             new_article.publish_date = publish_date
@@ -215,18 +365,22 @@ def publish():
         new_article.set_slug()
 
         # Handle the last_edited date
-        last_edited_str = request.form.get("last_edited")
+        last_edited_str = form.get("last_edited")
         if last_edited_str:
             last_edited = datetime.strptime(last_edited_str, "%Y-%m-%dT%H:%M")
             new_article.last_edited = last_edited
 
-        # Handle article categories
-        selected_category_ids = request.form.getlist("categories")
-        selected_categories = Category.query.filter(Category.id.in_(selected_category_ids)).all()
-        new_article.categories = selected_categories
-
         try:
             db.session.add(new_article)
+            db.session.flush()  # Assigns new_article.id for the link rows
+            if selected_category_ids:
+                db.session.execute(
+                    article_categories.insert(),
+                    [
+                        {"article_id": new_article.id, "category_id": category_id}
+                        for category_id in selected_category_ids
+                    ],
+                )
             db.session.commit()
 
             flash_message = (
@@ -307,6 +461,13 @@ def users():
             if int(user_id_to_delete) != current_user.id:
                 user_to_delete = User.query.get(user_id_to_delete)
                 if user_to_delete:
+                    # Detach their articles so a later account can never inherit them; this
+                    # also bumps updated_at, which refreshes ETags and cached feed cards
+                    db.session.execute(
+                        update(Article)
+                        .where(Article.author_id == user_to_delete.id)
+                        .values(author_id=None)
+                    )
                     db.session.delete(user_to_delete)
                     db.session.commit()
                     flash("🗑️ User deleted successfully.", "success")
@@ -332,12 +493,27 @@ def users():
 def article(slug):
     article = Article.query.filter_by(slug=slug).first_or_404()
 
+    # Check if the article is pending approval
+    if article.pending_approval:
+        # If the article is pending, only allow access to admins
+        if not current_user.is_authenticated or not current_user.is_admin:
+            flash(
+                "⛔️ Nuh uh uh, you didn't say the magic word...",
+                "warning",
+            )
+            return redirect(url_for("home"))
+
+    etag = public_page_etag()
+    if etag and request.if_none_match.contains(etag):
+        return not_modified(etag)
+
     # Convert the download size to a human-readable format for the template
     download_size_formatted = (
         format_size(int(article.download_size)) if article.download_size is not None else None
     )
 
-    content_html = markdown.markdown(article.content)
+    # The migration backfills content_html; rendering here is only a safety net
+    content_html = article.content_html or render_markdown(article.content)
 
     # Fetch related articles by type
     related_by_type = (
@@ -367,15 +543,12 @@ def article(slug):
 
     # Related articles by country with handling for multiple countries
     related_by_country_dict = {}
-    if article.country:
-        countries = article.country.split(", ")
-        for country in countries:
-            related_articles = Article.query.filter(
-                Article.country.like(f"%{country}%"), Article.id != article.id
-            ).all()
-            if country not in related_by_country_dict:
-                related_by_country_dict[country] = []
-            related_by_country_dict[country].extend(related_articles)
+    for country in article.countries:
+        related_by_country_dict[country.name] = (
+            Article.query.join(Article.countries)
+            .filter(Country.code == country.code, Article.id != article.id)
+            .all()
+        )
 
     # Collect all articles to determine top scopes
     all_articles = Article.query.all()
@@ -384,29 +557,18 @@ def article(slug):
         if a.article_types:
             for atype in a.article_types:
                 counter[("type", atype.name)] += 1
-        if a.country:
-            for c in a.country.split(", "):
-                counter[("country", c)] += 1
+        for c in a.countries:
+            counter[("country", c.name)] += 1
         if a.source:
             counter[("source", a.source)] += 1
 
-    # Check if the article is pending approval
-    if article.pending_approval:
-        # If the article is pending, only allow access to admins
-        if not current_user.is_authenticated or not current_user.is_admin:
-            flash(
-                "⛔️ Nuh uh uh, you didn't say the magic word...",
-                "warning",
-            )
-            return redirect(url_for("home"))
-
     # Get the top 5 scopes
     top_scopes = counter.most_common(5)
     all_scopes = [{"type": scope[0][0], "name": scope[0][1]} for scope in top_scopes]
 
     show_team_link = User.query.filter_by(include_in_team_page=True).first() is not None
 
-    return render_template(
+    page = render_template(
         "article.html",
         title=article.title,
         article=article,
@@ -418,6 +580,7 @@ def article(slug):
         all_scopes=all_scopes,
         show_team_link=show_team_link,
     )
+    return with_etag(page, etag)
 
 
 @app.route("/edit/<slug>", methods=["GET", "POST"])
@@ -425,7 +588,10 @@ def article(slug):
 def edit_article(slug):
     app.logger.info(f"Editing article with slug: {slug}")
 
-    article = Article.query.filter_by(slug=slug).first_or_404()
+    # Both the form and the update need the article's current categories
+    article = (
+        Article.query.options(selectinload(Article.categories)).filter_by(slug=slug).first_or_404()
+    )
     if not article:
         app.logger.warning(f"Article with slug {slug} not found")
         flash("Article not found.")
@@ -435,7 +601,7 @@ def edit_article(slug):
         flash("⛔️ This article is pending approval and cannot be edited.", "warning")
         return redirect(url_for("home"))
 
-    if not (current_user.username == article.author or current_user.is_admin):
+    if not (article.author_id == current_user.id or current_user.is_admin):
         app.logger.warning(
             f"Unauthorized edit attempt by user {current_user.username} on article {slug}"
         )
@@ -443,7 +609,7 @@ def edit_article(slug):
         return redirect(url_for("home"))
 
     categories = Category.query.all()
-    countries = [country.name for country in pycountry.countries]
+    countries = _COUNTRIES
     article_types = ArticleType.query.all()
 
     # Convert the download size from bytes for the edit form using format_size
@@ -459,46 +625,55 @@ def edit_article(slug):
     if request.method == "POST":
         app.logger.info(f"Processing POST request for editing article {slug}")
 
+        form = request.form
+        if not form.get("title", "").strip() or not form.get("content", "").strip():
+            flash("⛔️ Title and content are required.", "danger")
+            return redirect(url_for("edit_article", slug=slug))
+
         try:
             original_title = article.title
-            article.title = request.form["title"]
-            article.content = request.form["content"]
-            article.country = ", ".join(request.form.getlist("countries"))
+            article.title = form.get("title", "")
+            article.content = form.get("content", "")
+            article.content_html = render_markdown(article.content)
+            article.excerpt = make_excerpt(article.content_html)
+            article.countries = Country.query.filter(
+                Country.code.in_(form.getlist("countries"))
+            ).all()
 
             # Handle article types
-            selected_article_type_ids = request.form.getlist("article_types")
+            selected_article_type_ids = form.getlist("article_types")
             selected_article_types = ArticleType.query.filter(
                 ArticleType.id.in_(selected_article_type_ids)
             ).all()
             article.article_types = selected_article_types
 
             # Update DL links
-            article.download_link = request.form["download_link"]
-            article.download_link2 = request.form.get("download_link2")
-            article.download_link3 = request.form.get("download_link3")
+            article.download_link = form.get("download_link", "")
+            article.download_link2 = form.get("download_link2")
+            article.download_link3 = form.get("download_link3")
 
             # Update magnet links
-            article.magnet_link = request.form.get("magnet_link")
-            article.magnet_link2 = request.form.get("magnet_link2")
-            article.magnet_link3 = request.form.get("magnet_link3")
+            article.magnet_link = form.get("magnet_link")
+            article.magnet_link2 = form.get("magnet_link2")
+            article.magnet_link3 = form.get("magnet_link3")
 
             # Update torrent links
-            article.torrent_link = request.form.get("torrent_link")
-            article.torrent_link2 = request.form.get("torrent_link2")
-            article.torrent_link3 = request.form.get("torrent_link3")
+            article.torrent_link = form.get("torrent_link")
+            article.torrent_link2 = form.get("torrent_link2")
+            article.torrent_link3 = form.get("torrent_link3")
 
             # Update IPFS links
-            article.ipfs_link = request.form.get("ipfs_link")
-            article.ipfs_link2 = request.form.get("ipfs_link2")
-            article.ipfs_link3 = request.form.get("ipfs_link3")
+            article.ipfs_link = form.get("ipfs_link")
+            article.ipfs_link2 = form.get("ipfs_link2")
+            article.ipfs_link3 = form.get("ipfs_link3")
 
             # Update external collaboration links
-            article.external_collaboration = request.form.get("external_collaboration")
-            article.external_collaboration2 = request.form.get("external_collaboration2")
-            article.external_collaboration3 = request.form.get("external_collaboration3")
+            article.external_collaboration = form.get("external_collaboration")
+            article.external_collaboration2 = form.get("external_collaboration2")
+            article.external_collaboration3 = form.get("external_collaboration3")
 
             # Convert download size
-            article_download_size = request.form["download_size"]
+            article_download_size = form.get("download_size", "")
             try:
                 article.download_size = parse_size(article_download_size)
             except ValueError:
@@ -508,14 +683,14 @@ def edit_article(slug):
                 )
                 return redirect(url_for("edit_article", slug=slug))
 
-            article.source = request.form.get("source", "")
+            article.source = form.get("source", "")
 
             # Extract and handle the publication and last edited dates
-            publish_date_str = request.form.get("publish_date")
+            publish_date_str = form.get("publish_date")
             if publish_date_str:
                 article.publish_date = datetime.strptime(publish_date_str, "%Y-%m-%dT%H:%M")
 
-            last_edited_str = request.form.get("last_edited")
+            last_edited_str = form.get("last_edited")
             if last_edited_str:
                 article.last_edited = datetime.strptime(last_edited_str, "%Y-%m-%dT%H:%M")
 
@@ -531,12 +706,14 @@ def edit_article(slug):
                     count += 1
 
             # Handle categories
-            selected_category_ids = request.form.getlist("categories")
+            selected_category_ids = form.getlist("categories")
             selected_categories = Category.query.filter(
                 Category.id.in_(selected_category_ids)
             ).all()
             article.categories = selected_categories
 
+            # Relationship-only edits don't UPDATE the article row, so bump it explicitly
+            article.updated_at = datetime.utcnow()
             db.session.commit()
             app.logger.info(f"Article {slug} updated successfully")
             flash("👍 Article updated successfully.")
@@ -548,7 +725,8 @@ def edit_article(slug):
             return redirect(url_for("edit_article", slug=slug))
 
     else:
-        selected_countries = article.country.split(", ") if article.country else []
+        # A set keeps the template's per-country "checked" test constant-time
+        selected_countries = {country.code for country in article.countries}
         selected_categories = [category.id for category in article.categories]
         selected_article_type_ids = [atype.id for atype in article.article_types]
 
@@ -594,7 +772,7 @@ def articles_by_source(source):
 
 @app.route("/country/<country>")
 def articles_by_country(country):
-    articles = Article.query.filter(Article.country.like(f"%{country}%")).all()
+    articles = Article.query.join(Article.countries).filter(Country.name == country).all()
     article_count = len(articles)  # Get the count of articles
 
     # Use inject_scopes function to get the top scopes
@@ -620,7 +798,9 @@ def articles_by_country(country):
 
 @app.route("/author/<author>")
 def articles_by_author(author):
-    articles = Article.query.filter_by(author=author).all()
+    articles = (
+        Article.query.join(User, Article.author_id == User.id).filter(User.username == author).all()
+    )
     article_count = len(articles)  # Get the count of articles
 
     # Use inject_scopes function to get the top scopes
@@ -688,16 +868,12 @@ def all_categories():
         ArticleType.query.filter(ArticleType.articles.any()).order_by(ArticleType.name).all()
     )
 
-    # Fetch countries and sources from articles
+    # Fetch countries that have at least one article, and sources from articles
+    countries = [
+        country.name
+        for country in Country.query.filter(Country.articles.any()).order_by(Country.name)
+    ]
     articles = Article.query.all()
-    countries = sorted(
-        set(
-            country
-            for article in articles
-            for country in article.country.split(", ")
-            if article.country
-        )
-    )
     sources = sorted(set(article.source for article in articles if article.source))
 
     # Use inject_scopes function to get the top scopes
@@ -721,14 +897,20 @@ def all_categories():
 @app.route("/delete_article/<int:article_id>", methods=["POST"])
 @login_required
 def delete_article(article_id):
-    article = Article.query.get_or_404(article_id)
+    # Only the author is needed for the permission check, not the whole row
+    row = db.session.execute(select(Article.author_id).where(Article.id == article_id)).first()
+    if row is None:
+        abort(404)
 
     # Check if the current user is the author or an admin
-    if not (current_user.username == article.author or current_user.is_admin):
+    if not (row.author_id == current_user.id or current_user.is_admin):
         flash("⛔️ You do not have permission to delete this article.")
         return redirect(url_for("home"))
 
-    db.session.delete(article)
+    # Bulk deletes skip the ORM's secondary cleanup, so remove the link rows first
+    for link_table in article_link_tables:
+        db.session.execute(delete(link_table).where(link_table.c.article_id == article_id))
+    db.session.execute(delete(Article).where(Article.id == article_id))
     db.session.commit()
     flash("🗑️ Article deleted successfully.")
     return redirect(url_for("home"))
@@ -935,8 +1117,9 @@ def impact():
 
     # Top Country
     top_country = (
-        db.session.query(Article.country, db.func.count(Article.id))
-        .group_by(Article.country)
+        db.session.query(Country.name, db.func.count(Article.id))
+        .join(Article.countries)
+        .group_by(Country.name)
         .order_by(db.func.count(Article.id).desc())
         .first()
     )
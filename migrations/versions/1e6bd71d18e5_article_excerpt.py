@@ -0,0 +1,58 @@
+"""article excerpt
+
+Revision ID: 1e6bd71d18e5
+Revises: 2680582cd964
+Create Date: 2026-10-15 19:20:00.000000
+
+"""
+
+import html
+import re
+
+import markdown
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "1e6bd71d18e5"
+down_revision = "2680582cd964"
+branch_labels = None
+depends_on = None
+
+# Same preview as routes.make_excerpt, copied so the revision never changes with the app
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _make_excerpt(content_html, max_chars=200):
+    text = " ".join(html.unescape(_TAG_RE.sub(" ", content_html)).split())
+    return text if len(text) <= max_chars else text[:max_chars] + "..."
+
+
+def upgrade():
+    bind = op.get_bind()
+    columns = {column["name"] for column in sa.inspect(bind).get_columns("article")}
+    if "excerpt" not in columns:
+        with op.batch_alter_table("article") as batch_op:
+            batch_op.add_column(sa.Column("excerpt", sa.String(length=255), nullable=True))
+
+    # Give every legacy row an excerpt so Article.summary never has to slice raw Markdown;
+    # content_html is rendered in the same pass for any row that still lacks it
+    md = markdown.Markdown()
+    rows = bind.execute(
+        sa.text("SELECT id, content, content_html FROM article WHERE excerpt IS NULL")
+    )
+    backfill = []
+    for id_, content, content_html in rows:
+        if content_html is None:
+            content_html = md.reset().convert(content)
+        backfill.append({"id": id_, "html": content_html, "excerpt": _make_excerpt(content_html)})
+    if backfill:
+        bind.execute(
+            sa.text("UPDATE article SET content_html = :html, excerpt = :excerpt WHERE id = :id"),
+            backfill,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("article") as batch_op:
+        batch_op.drop_column("excerpt")
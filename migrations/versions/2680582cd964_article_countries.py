@@ -0,0 +1,76 @@
+"""move article.country into country and article_countries tables
+
+Revision ID: 2680582cd964
+Revises: 5b83439fc2ef
+Create Date: 2026-10-15 19:15:00.000000
+
+"""
+
+import pycountry
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2680582cd964"
+down_revision = "5b83439fc2ef"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    # Importing the app runs db.create_all(), which may already have made these tables
+    if "country" not in tables:
+        op.create_table(
+            "country",
+            sa.Column("code", sa.String(length=2), nullable=False),
+            sa.Column("name", sa.String(length=100), nullable=False),
+            sa.PrimaryKeyConstraint("code"),
+            sa.UniqueConstraint("name"),
+        )
+    if "article_countries" not in tables:
+        op.create_table(
+            "article_countries",
+            sa.Column("article_id", sa.Integer(), nullable=False),
+            sa.Column("country_code", sa.String(length=2), nullable=False),
+            sa.ForeignKeyConstraint(["article_id"], ["article.id"]),
+            sa.ForeignKeyConstraint(["country_code"], ["country.code"]),
+            sa.PrimaryKeyConstraint("article_id", "country_code"),
+        )
+
+    # The backfill matches on names, so every pycountry entry must exist first
+    existing_codes = set(bind.execute(sa.text("SELECT code FROM country")).scalars())
+    missing = [
+        {"code": country.alpha_2, "name": country.name}
+        for country in pycountry.countries
+        if country.alpha_2 not in existing_codes
+    ]
+    if missing:
+        bind.execute(sa.text("INSERT INTO country (code, name) VALUES (:code, :name)"), missing)
+
+    columns = {column["name"] for column in inspector.get_columns("article")}
+    if "country" in columns:
+        # article.country held ", "-joined names; pad both sides so "Niger" can't match "Nigeria"
+        op.execute(
+            "INSERT OR IGNORE INTO article_countries (article_id, country_code) "
+            "SELECT article.id, country.code FROM article JOIN country "
+            "ON ', ' || article.country || ', ' LIKE '%, ' || country.name || ', %'"
+        )
+        with op.batch_alter_table("article") as batch_op:
+            batch_op.drop_column("country")
+
+
+def downgrade():
+    with op.batch_alter_table("article") as batch_op:
+        batch_op.add_column(sa.Column("country", sa.String(length=50), nullable=True))
+    op.execute(
+        "UPDATE article SET country = ("
+        "SELECT group_concat(country.name, ', ') FROM article_countries "
+        "JOIN country ON country.code = article_countries.country_code "
+        "WHERE article_countries.article_id = article.id)"
+    )
+    op.drop_table("article_countries")
+    op.drop_table("country")
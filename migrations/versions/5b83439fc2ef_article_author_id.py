@@ -0,0 +1,65 @@
+"""replace article.author with an author_id foreign key
+
+Revision ID: 5b83439fc2ef
+Revises: f0b4a3d01b29
+Create Date: 2026-10-15 19:10:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b83439fc2ef"
+down_revision = "f0b4a3d01b29"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {column["name"] for column in inspector.get_columns("article")}
+    indexes = {index["name"] for index in inspector.get_indexes("article")}
+
+    if "author_id" not in columns:
+        with op.batch_alter_table("article") as batch_op:
+            batch_op.add_column(sa.Column("author_id", sa.Integer(), nullable=True))
+            batch_op.create_index("ix_article_author_id", ["author_id"])
+            batch_op.create_foreign_key("fk_article_author_id_user", "user", ["author_id"], ["id"])
+
+    if "author" in columns:
+        # Articles whose author no longer has an account keep a NULL author_id
+        op.execute(
+            "UPDATE article SET author_id = "
+            "(SELECT user.id FROM user WHERE user.username = article.author) "
+            "WHERE author_id IS NULL"
+        )
+        with op.batch_alter_table("article") as batch_op:
+            if "ix_article_author" in indexes:
+                batch_op.drop_index("ix_article_author")
+            batch_op.drop_column("author")
+
+    # Stop SQLite from handing a deleted user's id to the next account
+    user_sql = bind.execute(
+        sa.text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'user'")
+    ).scalar()
+    if "AUTOINCREMENT" not in user_sql.upper():
+        with op.batch_alter_table(
+            "user", recreate="always", table_kwargs={"sqlite_autoincrement": True}
+        ):
+            pass
+
+
+def downgrade():
+    with op.batch_alter_table("article") as batch_op:
+        batch_op.add_column(sa.Column("author", sa.String(length=50), nullable=True))
+    op.execute(
+        "UPDATE article SET author = "
+        "COALESCE((SELECT user.username FROM user WHERE user.id = article.author_id), '')"
+    )
+    with op.batch_alter_table("article") as batch_op:
+        batch_op.alter_column("author", existing_type=sa.String(length=50), nullable=False)
+        batch_op.create_index("ix_article_author", ["author"])
+        batch_op.drop_index("ix_article_author_id")
+        batch_op.drop_column("author_id")
@@ -0,0 +1,65 @@
+"""article content_html, updated_at and lookup indexes
+
+Revision ID: f0b4a3d01b29
+Revises: e0e9c18c229d
+Create Date: 2026-10-15 19:05:00.000000
+
+"""
+
+from datetime import datetime
+
+import markdown
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f0b4a3d01b29"
+down_revision = "e0e9c18c229d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # db.create_all() builds new databases at the latest schema, so skip what already exists
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    columns = {column["name"] for column in inspector.get_columns("article")}
+    indexes = {index["name"] for index in inspector.get_indexes("article")}
+
+    with op.batch_alter_table("article") as batch_op:
+        if "content_html" not in columns:
+            batch_op.add_column(sa.Column("content_html", sa.Text(), nullable=True))
+        if "updated_at" not in columns:
+            batch_op.add_column(sa.Column("updated_at", sa.DateTime(), nullable=True))
+        if "ix_article_publish_date" not in indexes:
+            batch_op.create_index("ix_article_publish_date", ["publish_date"])
+        if "ix_article_source" not in indexes:
+            batch_op.create_index("ix_article_source", ["source"])
+        # author is replaced by author_id in a later revision
+        if "author" in columns and "ix_article_author" not in indexes:
+            batch_op.create_index("ix_article_author", ["author"])
+
+    # Render legacy rows once here so article views never have to parse their Markdown
+    md = markdown.Markdown()
+    rows = bind.execute(sa.text("SELECT id, content FROM article WHERE content_html IS NULL"))
+    rendered = [{"id": id_, "html": md.reset().convert(content)} for id_, content in rows]
+    if rendered:
+        bind.execute(sa.text("UPDATE article SET content_html = :html WHERE id = :id"), rendered)
+
+    # Give existing rows a version so the home page ETag has something to compare. Use the
+    # server clock: publish_date/last_edited are user-entered local times that can lie in
+    # the future and would pin MAX(updated_at) until then.
+    bind.execute(
+        sa.text("UPDATE article SET updated_at = :now WHERE updated_at IS NULL").bindparams(
+            sa.bindparam("now", datetime.utcnow(), type_=sa.DateTime())
+        )
+    )
+
+
+def downgrade():
+    with op.batch_alter_table("article") as batch_op:
+        batch_op.drop_index("ix_article_author")
+        batch_op.drop_index("ix_article_source")
+        batch_op.drop_index("ix_article_publish_date")
+        batch_op.drop_column("updated_at")
+        batch_op.drop_column("content_html")